@@ -51,29 +51,38 @@ class App(QObject, DataFileProvider):
         locale.setlocale(locale.LC_NUMERIC, '')
 
         self._config = UnitedConfig(type(self), App)
-
-        self._gui_enabled = self._config.value('enable-gui')
+        config_values = self._config.values((
+            'enable-gui',
+            'max_general_thread_count',
+            'max_dnn_thread_count',
+            'warn-with-traceback',
+            'onnx_providers',
+            'opencv_io_max_image_pixels',
+            'plugins',
+        ))
+
+        self._gui_enabled = config_values['enable-gui']
         self._qApp = QApplication(sys.argv) if self._gui_enabled else QCoreApplication(sys.argv)
         self._qApp.setApplicationName(name)
         self._qApp.setApplicationVersion(version)
 
         ThreadPool.create_instance(
-            self._config.value('max_general_thread_count'),
-            self._config.value('max_dnn_thread_count'))
+            config_values['max_general_thread_count'],
+            config_values['max_dnn_thread_count'])
 
-        if self._config.value('warn-with-traceback'):
+        if config_values['warn-with-traceback']:
             warnings.showwarning = warn_with_traceback
             warnings.simplefilter('always')
 
-        OnnxConfig.providers = self._config.value('onnx_providers')
+        OnnxConfig.providers = config_values['onnx_providers']
 
-        os.environ['OPENCV_IO_MAX_IMAGE_PIXELS'] = str(self._config.value('opencv_io_max_image_pixels'))
+        os.environ['OPENCV_IO_MAX_IMAGE_PIXELS'] = str(config_values['opencv_io_max_image_pixels'])
 
         self._plugin_manager = PluginManager(self)
         self._plugin_manager.plugin_enabled.connect(self.plugin_enabled)
         self._plugin_manager.plugin_disabled.connect(self.plugin_disabled)
 
-        configured_plugins = self._config.value('plugins')
+        configured_plugins = config_values['plugins']
         if configured_plugins is not None:
             self._plugin_manager.enable_plugins(configured_plugins)
 
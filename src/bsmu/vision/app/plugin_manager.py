@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import collections.abc
 import importlib
-import re
-from functools import partial
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
@@ -12,11 +11,35 @@ from bsmu.vision.core.plugins.base import Plugin
 from bsmu.vision.core.plugins.observer import ObserverPlugin
 
 if TYPE_CHECKING:
-    from typing import List
+    from typing import List, Sequence, Type
 
     from bsmu.vision.app.base import App
 
 
+@lru_cache(maxsize=256)
+def _parsed_plugin_expression(plugin_expression: str) -> tuple[str | None, str, tuple[str, ...] | None, str | None]:
+    """
+    Parses plugin expression of the format: alias=full_name(arg1, arg2)->replace_full_name
+    (all parts except the full_name are optional)
+    The grammar is simple, so use str.partition instead of a regular expression.
+    :return: Tuple[alias, full_name, args, replace_full_name]
+    """
+    plugin_expression = plugin_expression.replace(' ', '')
+
+    plugin_expression, replace_separator, replace_full_name = plugin_expression.partition('->')
+    alias_with_full_name, args_start, args_with_end = plugin_expression.partition('(')
+    alias, alias_separator, full_name = alias_with_full_name.rpartition('=')
+    # Use tuple, because the result is cached and has to be immutable
+    args = tuple(args_with_end.rpartition(')')[0].split(',')) if args_start else None
+    return alias if alias_separator else None, full_name, args, replace_full_name if replace_separator else None
+
+
+@lru_cache(maxsize=None)
+def _plugin_class(full_name: str) -> Type[Plugin]:
+    module_name, class_name = full_name.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class PluginManager(QObject):
     plugin_enabling = Signal(Plugin)
     plugin_enabled = Signal(Plugin)
@@ -28,10 +51,6 @@ class PluginManager(QObject):
 
         self._app = app
 
-        self._plugin_expression_pattern_str = \
-            r'((?P<alias>.+)=)?(?P<full_name>[^->\(]+)(\((?P<args>.*)\))?\s*(->(?P<replace_full_name>.+))?'
-        self._plugin_expression_pattern = re.compile(self._plugin_expression_pattern_str)
-
         self._created_plugin_by_full_name = {}  # { full_name: Plugin }
         self._enabled_plugin_by_full_name = {}  # { full_name: Plugin }
         self._created_plugin_by_alias = {}  # { alias: Plugin }
@@ -65,7 +84,7 @@ class PluginManager(QObject):
     def _create_plugin(
             self,
             full_name: str,
-            args: List[str] | None = None,
+            args: Sequence[str] | None = None,
             replace_full_name: str | None = None,
             alias: str | None = None,
     ) -> Plugin:
@@ -77,8 +96,7 @@ class PluginManager(QObject):
 
         plugin = self._created_plugin_by_full_name.get(full_name)   #### or self._aliases_plugins.get(full_name)
         if plugin is None:
-            module_name, class_name = full_name.rsplit(".", 1)
-            plugin_class = getattr(importlib.import_module(module_name), class_name)
+            plugin_class = _plugin_class(full_name)
 
             dependency_plugin_by_key = {}
             for plugin_key, plugin_full_name in plugin_class.default_dependency_plugin_full_name_by_key.items():
@@ -99,22 +117,10 @@ class PluginManager(QObject):
         return plugin
 
     def _create_and_enable_plugin_from_expression(self, plugin_expression: str) -> Plugin:
-        plugin_expression = plugin_expression.replace(' ', '')
-
-        match = self._plugin_expression_pattern.match(plugin_expression)
-        alias = match.group('alias')
-        full_name = match.group('full_name')
-        args = match.group('args')
-        replace_full_name = match.group('replace_full_name')
+        alias, full_name, args, replace_full_name = _parsed_plugin_expression(plugin_expression)
 
         plugin = self._enabled_plugin_by_full_name.get(full_name)
         if plugin is None:
-            if replace_full_name is not None:
-                replace_full_name = replace_full_name.replace(' ', '')
-
-            if args is not None:
-                args = [arg.replace(' ', '') for arg in args.split(',')]
-
             plugin = self._create_plugin(full_name, args, replace_full_name, alias)
             self._enable_created_plugin(plugin, replace_full_name)
 
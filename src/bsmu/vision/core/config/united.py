@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from ruamel.yaml import YAML
 
 if TYPE_CHECKING:
-    from typing import Type, List, Any
+    from typing import Type, List, Any, Sequence
 
     from bsmu.vision.core.data_file import DataFileProvider
 
@@ -33,6 +33,17 @@ class UnitedConfig:
             result = self._data.get(key, self._SENTINEL)
         return default if result is self._SENTINEL else result
 
+    def values(self, keys: Sequence[str], default: Any = None) -> dict[str, Any]:
+        """
+        Get values of all |keys| at once.
+        Base class configs are united only until all keys are found (or there are no more base classes).
+        """
+        missing_keys = [key for key in keys if key not in self._data]
+        while missing_keys and self._last_united_base_class != self._last_base_cls_to_unite:
+            self._unite_with_next_base_class()
+            missing_keys = [key for key in missing_keys if key not in self._data]
+        return {key: self._data.get(key, default) for key in keys}
+
     @property
     def base_united_classes(self) -> List[Type[DataFileProvider]]:
         if self._base_united_classes is None:
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import cv2 as cv
 import numpy as np
 from PySide6.QtGui import QImage
@@ -11,15 +13,45 @@ def normalized(array: np.ndarray, min_range: float = 0, max_range: float = 1):
 
 
 def normalized_uint8(array: np.ndarray):
-    return normalized(array, 0, 255).astype(np.uint8)
+    # Gives the same result as |normalized(array, 0, 255).astype(np.uint8)|,
+    # but does arithmetic in place, instead of allocating a new temporary array for every operation
+    array_min = array.min()
+    normalized_array = array - array_min
+    is_float_array = np.issubdtype(normalized_array.dtype, np.floating)
+    normalized_array = np.true_divide(
+        normalized_array, (array.max() - array_min) or 1, out=normalized_array if is_float_array else None)
+    normalized_array *= 255
+    return normalized_array.astype(np.uint8)
+
+
+def uint16_to_uint8(array: np.ndarray) -> np.ndarray:
+    # Maps [0, 65535] range to [0, 255] with rounding in one pass (65535 / 257 = 255)
+    return cv.convertScaleAbs(array, alpha=1 / 257)
+
 
+# Depths supported by cv.cvtColor. For them alpha-channel is filled with the max value of depth (as in |gray2rgba|)
+_CV_COLOR_CONVERSION_DTYPES = (np.uint8, np.uint16, np.float32)
 
-def converted_to_rgba(image):
+
+def converted_to_rgba(image, out: np.ndarray | None = None):
+    """
+    :param out: optional preallocated array (or view into a bigger array) with the resulting shape and type.
+    Pass it to avoid new array allocation for every conversion, e.g. when the same image is converted repeatedly.
+    """
     if image.ndim == 2:  # one channel (grayscale image)
-        image = gray2rgba(image)
+        # cv.cvtColor expands channels and fills alpha-channel in one pass over pixels,
+        # so use it instead of |gray2rgba| (which makes several passes) for supported depths
+        if image.dtype in _CV_COLOR_CONVERSION_DTYPES:
+            image = cv.cvtColor(image, cv.COLOR_GRAY2RGBA, dst=out)
+        else:
+            image = gray2rgba(image)
     elif image.ndim == 3 and image.shape[2] == 3:  # 3-channel image
         # Add alpha-channel
-        image = cv.cvtColor(image, cv.COLOR_RGB2RGBA)
+        image = cv.cvtColor(image, cv.COLOR_RGB2RGBA, dst=out)
+
+    if out is not None and not np.may_share_memory(image, out):
+        out[...] = image
+        image = out
     return image
 
 
@@ -33,7 +65,9 @@ def numpy_array_to_qimage(numpy_array: np.ndarray, image_format: QImage.Format =
     # If shape has no channels use 1 as channel count
     channel_count = (channel_count and channel_count[0]) or 1
     bytes_per_line = width * channel_count * numpy_array.itemsize
-    return QImage(numpy_array.data, width, height, bytes_per_line, image_format)
+    # Pass the array itself (it supports buffer protocol) instead of |numpy_array.data|,
+    # so no intermediate memoryview object is created
+    return QImage(numpy_array, width, height, bytes_per_line, image_format)
 
 
 def numpy_bgra_image_to_qimage(numpy_image):
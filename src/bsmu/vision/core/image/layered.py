@@ -41,8 +41,10 @@ class ImageLayer(QObject):
         self._extension: str | None = None
         self.palette = None
 
-        self._image = None
-        self.image = image  # if image is not None else Image()
+        # Plain attribute instead of property to get fast access to the image (it is used on hot paths).
+        # Use |set_image| method to change it
+        self.image: Image | None = None
+        self.set_image(image)  # if image is not None else Image()
         self.name = name if name else 'Layer ' + str(self.id)
 
         self._visibility = Visibility() if visibility is None else visibility
@@ -84,32 +86,27 @@ class ImageLayer(QObject):
     def image_path_name(self) -> str:
         return self.image_path.name if self.image_path is not None else ''
 
-    @property  # TODO: this is slow. If we need only setter, there are alternatives without getter
-    def image(self) -> Image:
-        return self._image
-
-    @image.setter
-    def image(self, value: Image):
-        if self._image == value:
+    def set_image(self, value: Image | None):
+        if self.image is value:
             return
 
-        if self._image is not None:
-            self._image.pixels_modified.disconnect(self.image_pixels_modified)
-            self._image.shape_changed.disconnect(self.image_shape_changed)
+        if self.image is not None:
+            self.image.pixels_modified.disconnect(self.image_pixels_modified)
+            self.image.shape_changed.disconnect(self.image_shape_changed)
 
-        self._image = value
+        self.image = value
         self._on_image_updated()
 
-        if self._image is not None:
-            if self._image.path is not None:
-                self.extension = self._image.path.suffix
-            self.palette = self._image.palette
-            self._image.pixels_modified.connect(self.image_pixels_modified)
-            self._image.shape_changed.connect(self.image_shape_changed)
+        if self.image is not None:
+            if self.image.path is not None:
+                self.extension = self.image.path.suffix
+            self.palette = self.image.palette
+            self.image.pixels_modified.connect(self.image_pixels_modified)
+            self.image.shape_changed.connect(self.image_shape_changed)
 
     @property
     def is_indexed(self) -> bool:
-        return self._image.is_indexed
+        return self.image.is_indexed
 
     @property
     def is_image_pixels_valid(self) -> bool:
@@ -134,6 +131,8 @@ class LayeredImage(Data):
 
         self._layers: list[ImageLayer] = []
         self._layer_by_name = {}
+        # Allows to get layer index without linear search in the |_layers| list
+        self._layer_index_by_id: dict[int, int] = {}
 
     @property
     def layers(self) -> list[ImageLayer]:
@@ -147,6 +146,7 @@ class LayeredImage(Data):
         self.layer_adding.emit(layer, layer_index)
         self._layers.append(layer)
         self._layer_by_name[layer.name] = layer
+        self._layer_index_by_id[layer.id] = layer_index
         self.layer_added.emit(layer, layer_index)
 
     def add_layer_from_image(
@@ -161,7 +161,7 @@ class LayeredImage(Data):
         if layer is None:
             layer = self.add_layer_from_image(image, name, path, visibility)
         else:
-            layer.image = image
+            layer.set_image(image)
         return layer
 
     def add_layer_or_modify_pixels(
@@ -177,21 +177,25 @@ class LayeredImage(Data):
         if layer is None:
             layer = self.add_layer_from_image(image_type(pixels, palette), name, path, visibility)
         elif layer.image is None:
-            layer.image = image_type(pixels, palette)
+            layer.set_image(image_type(pixels, palette))
         else:
             layer.image.pixels = pixels
             layer.image.emit_pixels_modified()
         return layer
 
     def remove_layer(self, layer: ImageLayer):
-        layer_index = self._layers.index(layer)
+        layer_index = self._layer_index_by_id[layer.id]
         self.layer_removing.emit(layer, layer_index)
-        self._layers.remove(layer)
+        del self._layers[layer_index]
+        del self._layer_index_by_id[layer.id]
+        # Shift indexes of the next layers
+        for next_layer_index in range(layer_index, len(self._layers)):
+            self._layer_index_by_id[self._layers[next_layer_index].id] = next_layer_index
         del self._layer_by_name[layer.name]
         self.layer_removed.emit(layer, layer_index)
 
     def contains_layer(self, name: str) -> bool:
-        return self.layer_by_name(name) is not None
+        return name in self._layer_by_name
 
     def print_layers(self):
         for index, layer in enumerate(self.layers):
@@ -214,7 +218,7 @@ class LayerImageDependencyController(QObject):
 
     def corresponding_layer_image(self, slave_layer: ImageLayer):
         file_path = layer.path / next_file_name
-        layer.image = self.file_loading_manager.load_file(file_path, palette=layer.palette)
+        layer.set_image(self.file_loading_manager.load_file(file_path, palette=layer.palette))
 
     def _update_slave_layer_image(self, slave_layer: ImageLayer):
 
@@ -106,16 +106,15 @@ class RecordTableModel(QAbstractTableModel, metaclass=QABCMeta):
 
         if self._record_storage is not None:
             self._on_record_storage_changing()
-            for record in self.storage_records:
-                record_row = self.record_row(record)
+            # Use enumerate instead of |self.record_row| to avoid linear search of every record
+            for record_row, record in enumerate(self.storage_records):
                 self._on_record_removing(record, record_row)
                 self._on_record_removed(record, record_row)
 
         self._record_storage = value
 
         if self._record_storage is not None:
-            for record in self.storage_records:
-                record_row = self.record_row(record)
+            for record_row, record in enumerate(self.storage_records):
                 self._on_record_adding(record, record_row)
                 self._on_record_added(record, record_row)
             self._on_record_storage_changed()
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 
 
 class Palette:
+    # Soft palettes are used for every mask layer with 'rgb-color' config property, so share them.
+    # Shared palettes also share their cached premultiplied array and ARGB quadruplets (QImage color table)
+    _default_soft_palette_by_key: dict[tuple, Palette] = {}
+
     def __init__(self, array: np.ndarray, row_index_by_name: dict = None):
         self._array = array
         self._premultiplied_array_cache = None
@@ -45,12 +49,19 @@ class Palette:
 
     @classmethod
     def default_soft(cls, rgb_color: Tuple[int] | List[int] = (255, 255, 255)) -> Palette:
-        # Have to specify np.uint8 type explicitly, else it will be int32 type
-        rgb_color = np.array(rgb_color, dtype=np.uint8)
-        rpb_palette_array = np.tile(rgb_color, (256, 1))
-        alpha = np.arange(256, dtype=np.uint8)[:, np.newaxis]
-        palette_array = np.hstack((rpb_palette_array, alpha))
-        return cls(palette_array)
+        palette_key = (cls, tuple(rgb_color))
+        palette = cls._default_soft_palette_by_key.get(palette_key)
+        if palette is None:
+            # Have to specify np.uint8 type explicitly, else it will be int32 type
+            rgb_color = np.array(rgb_color, dtype=np.uint8)
+            rpb_palette_array = np.tile(rgb_color, (256, 1))
+            alpha = np.arange(256, dtype=np.uint8)[:, np.newaxis]
+            palette_array = np.hstack((rpb_palette_array, alpha))
+            # The palette is shared, so protect its array from modifications
+            palette_array.setflags(write=False)
+            palette = cls(palette_array)
+            cls._default_soft_palette_by_key[palette_key] = palette
+        return palette
 
     @classmethod
     def from_config(cls, palette_config_data: list | dict | None) -> Palette | None:
@@ -126,11 +137,15 @@ class Palette:
     @property
     def premultiplied_array(self) -> np.ndarray:
         if self._premultiplied_array_cache is None:
-            self._premultiplied_array_cache = np.zeros_like(self._array)
-            self._premultiplied_array_cache[:, :3] = np.rint(self._array[:, :3] * (self._array[:, 3:4] / 255))
-            # brackets are required, else multiplication of |self._array| could be overflowed
-            # (because it has np.uint8 type)
-
+            self._premultiplied_array_cache = np.empty_like(self._array)
+            # Use exact integer arithmetic instead of float division and rounding:
+            # (x * a + 127) // 255 is equal to round(x * a / 255), because x * a / 255 can never be exactly halfway
+            # between two integers. np.uint16 type is required, else multiplication could be overflowed
+            rgb = self._array[:, :3].astype(np.uint16)
+            rgb *= self._array[:, 3:4]
+            rgb += 127
+            rgb //= 255
+            self._premultiplied_array_cache[:, :3] = rgb
             self._premultiplied_array_cache[:, 3] = self._array[:, 3]
         return self._premultiplied_array_cache
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
     from bsmu.vision.plugins.windows.main import MainWindowPlugin, MainWindow
     from bsmu.vision.plugins.doc_interfaces.mdi import MdiPlugin, Mdi
 
+logger = logging.getLogger(__name__)
+
 
 class ColorContrastPlugin(Plugin):
     _DEFAULT_DEPENDENCY_PLUGIN_FULL_NAME_BY_KEY = {
@@ -206,14 +209,19 @@ class ColorContrast(QObject):
             return
 
         layered_image = active_sub_window.viewer.data
-        layered_image.print_layers()
         image = layered_image.layer_by_name('series').image
-        print('stat', image.array.shape, image.array.min(), image.array.max(), image.array.dtype)
-        print(np.unique(image.array))
+        # Calculate statistics only in debug mode, because np.unique sorts the whole volume
+        is_debug_logging_enabled = logger.isEnabledFor(logging.DEBUG)
+        if is_debug_logging_enabled:
+            for index, layer in enumerate(layered_image.layers):
+                logger.debug('Layer %s: %s', index, layer.name)
+            logger.debug('stat %s %s %s %s', image.array.shape, image.array.min(), image.array.max(), image.array.dtype)
+            logger.debug('%s', np.unique(image.array))
 
         discrete_color_len = 2000
         norm = (image.array / image.array.max() * (discrete_color_len - 1)).astype(np.int)
-        print('norm stat', norm.shape, norm.min(), norm.max(), norm.dtype)
+        if is_debug_logging_enabled:
+            logger.debug('norm stat %s %s %s %s', norm.shape, norm.min(), norm.max(), norm.dtype)
 
         color_transfer_function = ColorTransferFunction()
         # color_transfer_function.add_point_from_x_color(0, np.array([255, 76, 76, 255]))
@@ -238,10 +246,9 @@ class ColorContrast(QObject):
         fp = [point.color_array for point in color_transfer_function.points]
         interpolator = interpolate.interp1d(xp, fp, axis=0, assume_sorted=True)
         result = interpolator(np.arange(discrete_color_len))
-        print('res', result.shape, '\n', result)
+        logger.debug('res %s', result.shape)
 
         palette_array = np.array(result.round(), dtype=np.uint8)
-        print('rounded', palette_array)
         palette = Palette(palette_array)
 
         indexed_image = VolumeImage(norm, palette, spatial=image.spatial)
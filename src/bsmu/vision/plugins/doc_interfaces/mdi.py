@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QTimer, QSize
 from PySide6.QtGui import QResizeEvent
 from PySide6.QtWidgets import QMdiArea, QMdiSubWindow, QMessageBox
 
@@ -49,11 +49,22 @@ class Mdi(QMdiArea):
     sub_window_adding = Signal(QMdiSubWindow)
     sub_window_added = Signal(QMdiSubWindow)
 
+    # Emitted after sub-windows are laid out to their anchors.
+    # Several resize events received during one event loop iteration are coalesced into one emission.
     resized = Signal(QResizeEvent)
 
     def __init__(self):
         super().__init__()
 
+        # Lay out sub-windows once per event loop iteration, even if several resize events were received
+        self._sub_windows_lay_out_timer = QTimer(self)
+        self._sub_windows_lay_out_timer.setSingleShot(True)
+        self._sub_windows_lay_out_timer.setInterval(0)
+        self._sub_windows_lay_out_timer.timeout.connect(self._on_sub_windows_lay_out_timeout)
+
+        # Size before the first of the coalesced resize events
+        self._size_before_resize: QSize | None = None
+
     def add_sub_window(self, sub_window: QMdiSubWindow) -> QMdiSubWindow:
         self.sub_window_adding.emit(sub_window)
         super().addSubWindow(sub_window)
@@ -76,7 +87,18 @@ class Mdi(QMdiArea):
     def resizeEvent(self, resize_event: QResizeEvent):
         super().resizeEvent(resize_event)
 
-        for sub_window in self.subWindowList():
-            sub_window.lay_out_to_anchors()
+        if self._size_before_resize is None:
+            self._size_before_resize = resize_event.oldSize()
+        self._sub_windows_lay_out_timer.start()
 
+    def _on_sub_windows_lay_out_timeout(self):
+        self._lay_out_sub_windows_to_anchors()
+
+        # Create a new event, because Qt deletes the received resize events after handling
+        resize_event = QResizeEvent(self.size(), self._size_before_resize)
+        self._size_before_resize = None
         self.resized.emit(resize_event)
+
+    def _lay_out_sub_windows_to_anchors(self):
+        for sub_window in self.subWindowList():
+            sub_window.lay_out_to_anchors()
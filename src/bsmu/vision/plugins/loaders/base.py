@@ -28,18 +28,15 @@ class FileLoaderMeta(type(QObject), abc.ABCMeta):
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
 
-        if not inspect.isabstract(cls) and not cls.formats:
+        if not inspect.isabstract(cls) and not cls._FORMATS:
             raise NotImplementedError('Subclass must define _FORMATS attribute')
 
-        return cls
-
-    @property
-    def formats(cls) -> tuple:
-        return cls._FORMATS
+        # Formats are static for every class, so store them as plain class attributes
+        # instead of metaclass properties to avoid descriptor calls on every lookup
+        cls.formats = cls._FORMATS
+        cls.processed_keys = cls._FORMATS
 
-    @property
-    def processed_keys(cls) -> tuple:
-        return cls.formats
+        return cls
 
 
 class FileLoader(QObject, metaclass=FileLoaderMeta):
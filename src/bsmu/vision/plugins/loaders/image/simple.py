@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import cv2 as cv
 import numpy as np
 
-from bsmu.vision.core.image.base import FlatImage
+from bsmu.vision.core.image.base import FlatImage, VolumeImage
 from bsmu.vision.plugins.loaders.image.base import ImageFileLoaderPlugin, ImageFileLoader
 
 if TYPE_CHECKING:
+    from typing import Sequence
     from pathlib import Path
 
+    from bsmu.vision.core.palette import Palette
+
 
 class SimpleImageFileLoaderPlugin(ImageFileLoaderPlugin):
     def __init__(self):
@@ -24,6 +29,47 @@ class SimpleImageFileLoader(ImageFileLoader):
     def _load_file(self, path: Path, palette=None, as_gray=False, **kwargs):
         logging.info('Load Simple Image')
 
+        assert not as_gray, 'as_gray flag is unimplemented'
+        pixels = self._decoded_pixels(path, palette)
+        flat_image = FlatImage(pixels, palette, path)
+        return flat_image
+
+    def load_files(self, paths: Sequence[Path], palette: Palette = None) -> VolumeImage:
+        """
+        Decode all |paths| (e.g. a directory of slices) in parallel threads into one preallocated stack.
+        OpenCV releases the GIL while decoding, so this works much faster than separate |load_file| calls.
+        All images have to be of the same shape and type.
+        Emits |file_loaded| signal only once with the resulting volume image.
+        :return: volume image, whose path is the parent directory of the first path
+        """
+        if not paths:
+            raise ValueError('At least one path is required to load images into a stack')
+
+        logging.info(f'Load {len(paths)} Simple Images')
+
+        first_pixels = self._decoded_pixels(paths[0], palette)
+        stack = np.empty((len(paths),) + first_pixels.shape, dtype=first_pixels.dtype)
+        stack[0] = first_pixels
+
+        def decode_into_stack(index: int):
+            pixels = self._decoded_pixels(paths[index], palette)
+            if pixels.shape != first_pixels.shape or pixels.dtype != first_pixels.dtype:
+                raise ValueError(
+                    f'Image {paths[index]} ({pixels.shape}, {pixels.dtype}) does not match '
+                    f'the first image {paths[0]} ({first_pixels.shape}, {first_pixels.dtype})')
+            stack[index] = pixels
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Iterate over results to propagate exceptions raised in worker threads
+            for _ in executor.map(decode_into_stack, range(1, len(paths))):
+                pass
+
+        volume_image = VolumeImage(stack, palette, paths[0].parent)
+        self.file_loaded.emit(volume_image)
+        return volume_image
+
+    @staticmethod
+    def _decoded_pixels(path: Path, palette: Palette = None) -> np.ndarray:
         # Do not use skimage, because:
         # a) OpenCV works a little faster
         # b) skimage can use different plugins (we do not know exactly which one will be used)
@@ -33,7 +79,6 @@ class SimpleImageFileLoader(ImageFileLoader):
         # Do not use cv.imread, because it works only with ASCII characters in file path
         # pixels = cv.imread(str(path), cv.IMREAD_UNCHANGED)
 
-        assert not as_gray, 'as_gray flag is unimplemented'
         # Use numpy.fromfile because it supports Unicode characters in file path
         pixels = cv.imdecode(np.fromfile(path, dtype=np.uint8), cv.IMREAD_UNCHANGED)
         channel_count = pixels.shape[-1] if pixels.ndim == 3 else 1
@@ -49,7 +94,10 @@ class SimpleImageFileLoader(ImageFileLoader):
 
         if palette is not None and pixels.dtype != np.uint8:
             logging.warning(f'Strange image with palette and {pixels.dtype} type')
-            pixels = np.rint(pixels).astype(np.uint8)
+            if np.issubdtype(pixels.dtype, np.floating):
+                # Round in place to avoid a temporary array (|pixels| is a new decoded array, so we own it)
+                np.rint(pixels, out=pixels)
+            # Integer pixels need no rounding
+            pixels = pixels.astype(np.uint8)
 
-        flat_image = FlatImage(pixels, palette, path)
-        return flat_image
+        return pixels
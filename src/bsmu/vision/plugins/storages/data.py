@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
@@ -10,6 +11,8 @@ from bsmu.vision.core.data import Data
 if TYPE_CHECKING:
     from bsmu.vision.plugins.loaders.manager import FileLoadingManagerPlugin, FileLoadingManager
 
+logger = logging.getLogger(__name__)
+
 
 class DataStoragePlugin(Plugin):
     _DEFAULT_DEPENDENCY_PLUGIN_FULL_NAME_BY_KEY = {
@@ -47,5 +50,6 @@ class DataStorage(QObject):  # TODO: use ItemStorage as base class
 
     def add_data(self, data: Data):
         self._data_array.append(data)
-        print('Storage data:', self._data_array)
+        # Use lazy %-formatting, because the reprs of all stored data are not needed when debug logging is disabled
+        logger.debug('Storage data: %s', self._data_array)
         self.data_added.emit(data)
@@ -7,6 +7,7 @@ from PySide6.QtCore import Qt, QObject, Signal
 from PySide6.QtGui import QCursor, QPixmap, QAction, QIcon
 from PySide6.QtWidgets import QWidget, QDockWidget
 
+from bsmu.vision.core.image.base import FlatImage
 from bsmu.vision.core.palette import Palette
 from bsmu.vision.core.plugins.base import Plugin
 from bsmu.vision.plugins.tools.images import icons_rc  # noqa: F401
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from PySide6.QtWidgets import QMdiSubWindow
 
     from bsmu.vision.core.config.united import UnitedConfig
-    from bsmu.vision.core.image.base import Image, FlatImage
+    from bsmu.vision.core.image.base import Image
     from bsmu.vision.plugins.doc_interfaces.mdi import MdiPlugin, Mdi
     from bsmu.vision.plugins.palette.settings import PalettePackSettingsPlugin, PalettePackSettings
     from bsmu.vision.plugins.undo import UndoPlugin, UndoManager
@@ -237,11 +238,12 @@ class MdiViewerTool(QObject):
         if not isinstance(sub_window, LayeredImageViewerSubWindow):
             return None
 
-        viewer_tool = self._viewer_tool_by_sub_window.get(sub_window)
-        if viewer_tool is None:
+        try:
+            return self._viewer_tool_by_sub_window[sub_window]
+        except KeyError:
             viewer_tool = self._tool_csl(sub_window.viewer, self._undo_manager, self._tool_settings)
             self._viewer_tool_by_sub_window[sub_window] = viewer_tool
-        return viewer_tool
+            return viewer_tool
 
 
 class ViewerToolSettings(QObject):
@@ -456,13 +458,26 @@ class LayeredImageViewerTool(ViewerTool):
 
     def _update_masks(self):
         if self.mask_layer.image is None:
-            self.mask_layer.image = self.image_layer_view.image.zeros_mask(palette=self.mask_layer.palette)
+            self.mask_layer.set_image(self.image_layer_view.image.zeros_mask(palette=self.mask_layer.palette))
             self.viewer.layer_view_by_model(self.mask_layer).slice_number = self.image_layer_view.slice_number
 
-        self.tool_mask_layer.image = self.image_layer_view.image.zeros_mask(palette=self.tool_mask_layer.palette)
+        self._reset_tool_mask()
         self.viewer.layer_view_by_model(self.tool_mask_layer).slice_number = \
             self.viewer.layer_view_by_model(self.mask_layer).slice_number
 
+    def _reset_tool_mask(self):
+        image = self.image_layer_view.image
+        tool_mask = self.tool_mask_layer.image
+        # Zero the existing flat tool mask in place instead of allocating a new one on every image view update.
+        # Volume masks are still reallocated, because |np.zeros| gets lazily zeroed memory pages,
+        # while only one slice of a volume is displayed (so most of the pages are never touched).
+        if (isinstance(image, FlatImage) and type(tool_mask) is type(image)
+                and tool_mask.shape == image.shape[:image.n_dims] and tool_mask.spatial is image.spatial):
+            tool_mask.pixels.fill(0)
+            tool_mask.emit_pixels_modified()
+        else:
+            self.tool_mask_layer.set_image(image.zeros_mask(palette=self.tool_mask_layer.palette))
+
     def pos_to_layered_image_item_pos(self, viewport_pos: QPoint) -> QPointF:
         return self.viewer.viewport_pos_to_layered_image_item_pos(viewport_pos)
 
@@ -472,5 +487,5 @@ class LayeredImageViewerTool(ViewerTool):
     def pos_f_to_image_pixel_indexes(self, viewport_pos_f: QPointF, image: Image) -> np.ndarray:
         return self.pos_to_image_pixel_indexes(viewport_pos_f.toPoint(), image)
 
-    def pos_to_image_pixel_indexes_rounded(self, viewport_pos: QPoint, image: Image) -> np.ndarray:
+    def pos_to_image_pixel_indexes_rounded(self, viewport_pos: QPoint, image: Image) -> tuple[int, int]:
         return self.viewer.viewport_pos_to_image_pixel_indexes_rounded(viewport_pos, image)
@@ -52,7 +52,8 @@ class DataVisualizer(QObject, metaclass=DataVisualizerMeta):
 
     def visualize_data(self, data: Data) -> List[DataViewerSubWindow]:
         data_viewer_sub_windows = self._visualize_data(data)
-        self.data_visualized.emit(data_viewer_sub_windows)
+        if data_viewer_sub_windows:
+            self.data_visualized.emit(data_viewer_sub_windows)
         return data_viewer_sub_windows
 
     @abc.abstractmethod
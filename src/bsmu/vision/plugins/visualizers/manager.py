@@ -67,4 +67,5 @@ class DataVisualizationManager(QObject):
             visualizer = visualizer_cls_with_settings.processor_cls(
                 self.mdi, visualizer_cls_with_settings.processor_settings)
             data_viewer_sub_windows = visualizer.visualize_data(data)
-            self.data_visualized.emit(data, data_viewer_sub_windows)
+            if data_viewer_sub_windows:
+                self.data_visualized.emit(data, data_viewer_sub_windows)
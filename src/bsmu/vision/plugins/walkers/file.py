@@ -179,4 +179,4 @@ class ImageLayerFileWalker(QObject):
             file_path = layer.path / requested_file_relative_path
             if layer != self._image_viewer.active_layer and layer.extension is not None:
                 file_path = file_path.with_suffix(layer.extension)
-            layer.image = self._file_loading_manager.load_file(file_path, palette=layer.palette)
+            layer.set_image(self._file_loading_manager.load_file(file_path, palette=layer.palette))
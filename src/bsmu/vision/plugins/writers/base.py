@@ -27,14 +27,13 @@ class FileWriterMeta(type(QObject), abc.ABCMeta):
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
 
-        if not inspect.isabstract(cls) and not cls.formats:
+        if not inspect.isabstract(cls) and not cls._FORMATS:
             raise NotImplementedError('Subclass must define _FORMATS attribute')
 
-        return cls
+        # Formats are static for every class, so store them as plain class attribute
+        cls.formats = cls._FORMATS
 
-    @property
-    def formats(cls) -> tuple:
-        return cls._FORMATS
+        return cls
 
 
 class FileWriter(QObject, metaclass=FileWriterMeta):
@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import cv2 as cv
+import numpy as np
 import skimage.io
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
@@ -117,9 +119,63 @@ class GenericImageFileWriterPlugin(FileWriterPlugin):
 class GenericImageFileWriter(FileWriter):
     _FORMATS = ('png', 'jpg', 'jpeg', 'bmp', 'tif', 'tiff')
 
+    # Types of pixels, which can be encoded by OpenCV for every file extension
+    _CV_DTYPES_BY_EXTENSION = {
+        '.png': (np.uint8, np.uint16),
+        '.jpg': (np.uint8,),
+        '.jpeg': (np.uint8,),
+        '.bmp': (np.uint8,),
+        '.tif': (np.uint8, np.uint16, np.float32),
+        '.tiff': (np.uint8, np.uint16, np.float32),
+    }
+
+    def __init__(self, png_compression_level: int = 1):
+        """
+        :param png_compression_level: zlib compression level (0-9) of PNG files.
+        Masks contain mostly zeros, so low levels give a little bigger files, but encode much faster
+        than the default level 6 of skimage (imageio).
+        """
+        super().__init__()
+
+        self._png_compression_level = png_compression_level
+
     def _write_to_file(self, data: Image, path: Path, **kwargs):
         # TODO: move the logging into base class
         logging.info(f'Write Generic Image: {path}')
 
-        # TODO: use OpenCV to save the image (compare performance and size of the resulting files)
-        skimage.io.imsave(str(path), data.pixels, check_contrast=False)
+        # Use OpenCV instead of skimage, because skimage checks contrast and type of the pixels (the additional
+        # passes over all pixels) and can use different plugins (we do not know exactly which one will be used)
+        pixels = data.pixels
+        extension = path.suffix.lower()
+        channel_count = pixels.shape[-1] if pixels.ndim == 3 else 1
+        # OpenCV cannot encode images with other number of channels (e.g. gray with alpha)
+        if channel_count in (1, 3, 4) and pixels.dtype in self._CV_DTYPES_BY_EXTENSION.get(extension, ()):
+            self._write_using_cv(pixels, channel_count, path, extension)
+        else:
+            skimage.io.imsave(str(path), pixels, check_contrast=False)
+
+    def _write_using_cv(self, pixels: np.ndarray, channel_count: int, path: Path, extension: str):
+        match channel_count:
+            case 3:
+                pixels = cv.cvtColor(pixels, cv.COLOR_RGB2BGR)
+            case 4:
+                pixels = cv.cvtColor(pixels, cv.COLOR_RGBA2BGRA)
+
+        match extension:
+            case '.png':
+                params = [cv.IMWRITE_PNG_COMPRESSION, self._png_compression_level]
+            case '.tif' | '.tiff':
+                # Use Deflate (zlib) without predictor instead of the default LZW of OpenCV,
+                # because tifffile (used by skimage) can decode LZW and floating point predictor
+                # only with the optional imagecodecs package
+                params = [cv.IMWRITE_TIFF_COMPRESSION, cv.IMWRITE_TIFF_COMPRESSION_ADOBE_DEFLATE,
+                          cv.IMWRITE_TIFF_PREDICTOR, cv.IMWRITE_TIFF_PREDICTOR_NONE]
+            case _:
+                params = []
+        # Do not use cv.imwrite, because it works only with ASCII characters in file path
+        is_encoded, encoded_pixels = cv.imencode(extension, pixels, params)
+        if not is_encoded:
+            raise ValueError(
+                f'Cannot encode the image with shape {pixels.shape} and {pixels.dtype} type to {extension}')
+        # Use numpy.tofile because it supports Unicode characters in file path
+        encoded_pixels.tofile(path)
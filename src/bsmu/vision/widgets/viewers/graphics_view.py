@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-from functools import partial
 from typing import TYPE_CHECKING
 
-import numpy as np
-from PySide6.QtCore import Qt, QObject, Signal, QTimeLine, QEvent, QRect, QRectF, QPointF
-from PySide6.QtGui import QPainter, QFont, QColor, QPainterPath, QPen, QFontMetrics
+from PySide6.QtCore import Qt, QObject, Signal, QTimer, QElapsedTimer, QEvent, QRect, QRectF, QPointF, QPoint, QSize
+from PySide6.QtGui import QPainter, QFont, QColor, QPainterPath, QPen, QFontMetrics, QPixmap, QRegion
 from PySide6.QtWidgets import QGraphicsView
 
 from bsmu.vision.core.settings import Settings
@@ -59,6 +57,10 @@ class GraphicsView(QGraphicsView):
         self._scale_font.setBold(True)
         self._scale_font_metrics = QFontMetrics(self._scale_font)
         self._scale_text_rect = QRect()
+        # Cache the scale text with outline, because QPainterPath text building is too slow to do it on every paint
+        self._scale_text_pixmap: QPixmap | None = None
+        self._scale_text_pixmap_scale: float | None = None
+        self._scale_text_pixmap_viewport_size = QSize()
 
         self._viewport_anchors = None
         self._reset_viewport_anchors()
@@ -121,32 +123,51 @@ class GraphicsView(QGraphicsView):
             self._anchor_viewport()
             self._viewport_anchoring_scheduled = False
 
-        painter = QPainter(self.viewport())
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QColor(123, 184, 234))
-        painter.setPen(QPen(Qt.white, 0.5))
+        viewport_size = self.viewport().size()
+        if self._scale_text_pixmap_scale != self._cur_scale or self._scale_text_pixmap_viewport_size != viewport_size:
+            self._update_scale_text_pixmap(viewport_size)
 
+        # Skip the painter creation, if only other parts of the viewport are repainted (e.g. while drawing a mask)
+        if event.region().intersects(self._scale_text_rect):
+            painter = QPainter(self.viewport())
+            painter.drawPixmap(self._scale_text_rect.topLeft(), self._scale_text_pixmap)
+
+    def _update_scale_text_pixmap(self, viewport_size: QSize):
         scale_text = f'{self._cur_scale * 100:.0f}%'
         scale_text_bounding_rect = self._scale_font_metrics.boundingRect(scale_text)
-        viewport_rect = self.viewport().rect()
         # Align the scale text to (Qt.AlignHCenter | Qt.AlignBottom)
         pad = 2
-        self._scale_text_rect = QRect(viewport_rect.width() / 2 - scale_text_bounding_rect.width() / 2,
-                                      viewport_rect.height() - scale_text_bounding_rect.height() - 6,
+        self._scale_text_rect = QRect(viewport_size.width() / 2 - scale_text_bounding_rect.width() / 2,
+                                      viewport_size.height() - scale_text_bounding_rect.height() - 6,
                                       scale_text_bounding_rect.width(), scale_text_bounding_rect.height())\
             .adjusted(-pad, -pad, pad, pad)  # add pads to update when scrolling without artifacts
 
+        device_pixel_ratio = self.viewport().devicePixelRatioF()
+        self._scale_text_pixmap = QPixmap(self._scale_text_rect.size() * device_pixel_ratio)
+        self._scale_text_pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self._scale_text_pixmap.fill(Qt.transparent)
+
+        painter = QPainter(self._scale_text_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QColor(123, 184, 234))
+        painter.setPen(QPen(Qt.white, 0.5))
+
         # Use QPainterPath to draw text with outline
         path = QPainterPath()
-        path.addText(self._scale_text_rect.bottomLeft(), self._scale_font, scale_text)
+        path.addText(QPoint(0, self._scale_text_rect.height() - 1), self._scale_font, scale_text)
         painter.drawPath(path)
+        painter.end()
+
+        self._scale_text_pixmap_scale = self._cur_scale
+        self._scale_text_pixmap_viewport_size = viewport_size
 
     def scrollContentsBy(self, dx: int, dy: int):
         super().scrollContentsBy(dx, dy)
 
-        # Update old (to clear text) and new rectangles (to draw) with the scale text
-        self.viewport().update(self._scale_text_rect)
-        self.viewport().update(self._scale_text_rect.translated(dx, dy))
+        # Update old (to clear text) and new rectangles (to draw) with the scale text using one region
+        scale_text_region = QRegion(self._scale_text_rect)
+        scale_text_region += self._scale_text_rect.translated(dx, dy)
+        self.viewport().update(scale_text_region)
 
         self._update_viewport_anchors()
 
@@ -176,15 +197,18 @@ class GraphicsView(QGraphicsView):
         if scene_rect.isEmpty():
             return
 
-        scene_size = np.array([scene_rect.width(), scene_rect.height()])
+        scene_width = scene_rect.width()
+        scene_height = scene_rect.height()
 
         viewport_rect = self.viewport().rect()
         top_left_viewport_point = self.mapToScene(viewport_rect.topLeft())
         bottom_right_viewport_point = self.mapToScene(viewport_rect.bottomRight())
 
-        self._viewport_anchors[0] = np.array([top_left_viewport_point.x(), top_left_viewport_point.y()]) / scene_size
+        # Use plain floats instead of NumPy arrays, because NumPy calls are too expensive for such small computations
+        self._viewport_anchors[0] = \
+            (top_left_viewport_point.x() / scene_width, top_left_viewport_point.y() / scene_height)
         self._viewport_anchors[1] = \
-            np.array([bottom_right_viewport_point.x(), bottom_right_viewport_point.y()]) / scene_size
+            (bottom_right_viewport_point.x() / scene_width, bottom_right_viewport_point.y() / scene_height)
 
     def resizeEvent(self, resize_event: QResizeEvent):
         self._schedule_viewport_anchoring()
@@ -193,18 +217,20 @@ class GraphicsView(QGraphicsView):
         self._viewport_anchoring_scheduled = True
 
     def _reset_viewport_anchors(self):
-        self._viewport_anchors = np.array([[0, 0], [1, 1]], dtype=float)
+        self._viewport_anchors = [(0.0, 0.0), (1.0, 1.0)]
         self._schedule_viewport_anchoring()
 
     def _anchor_viewport(self):
         self._viewport_anchoring = True
 
         scene_rect = self.sceneRect()
-        scene_size = np.array([scene_rect.width(), scene_rect.height()])
+        scene_width = scene_rect.width()
+        scene_height = scene_rect.height()
 
-        viewport_rect_angle_point_coords = self._viewport_anchors * scene_size
-        viewport_rect = QRectF(QPointF(*viewport_rect_angle_point_coords[0]),
-                               QPointF(*viewport_rect_angle_point_coords[1]))
+        (top_left_anchor_x, top_left_anchor_y), (bottom_right_anchor_x, bottom_right_anchor_y) = \
+            self._viewport_anchors
+        viewport_rect = QRectF(QPointF(top_left_anchor_x * scene_width, top_left_anchor_y * scene_height),
+                               QPointF(bottom_right_anchor_x * scene_width, bottom_right_anchor_y * scene_height))
         self.fit_in_view(viewport_rect, Qt.KeepAspectRatio)
 
         self._viewport_anchoring = False
@@ -245,6 +271,14 @@ class _ViewSmoothZoom(QObject):
 
         self._settings = settings
 
+        # Use one timer for all simultaneous zooms (e.g. during fast wheel scrolling)
+        # instead of creating a new timeline object for every wheel event
+        self._active_zooms: list[_Zoom] = []
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setInterval(SMOOTH_ZOOM_UPDATE_INTERVAL)
+        self._zoom_timer.timeout.connect(self._on_zoom_timer_timeout)
+        self._elapsed_timer = QElapsedTimer()
+
     def eventFilter(self, watched_obj, event):
         if event.type() == QEvent.Wheel:
             self.on_wheel_scrolled(event)
@@ -255,20 +289,38 @@ class _ViewSmoothZoom(QObject):
     def on_wheel_scrolled(self, event):
         angle_in_degrees = event.angleDelta().y() / 8
         zoom_factor = angle_in_degrees / 60 * self._settings.zoom_factor
-        zoom_factor = 1 + zoom_factor / (SMOOTH_ZOOM_DURATION / SMOOTH_ZOOM_UPDATE_INTERVAL)
-
-        zoom = _Zoom(event.position(), zoom_factor)
-        zoom_time_line = _ZoomTimeLine(SMOOTH_ZOOM_DURATION, self)
-        zoom_time_line.setUpdateInterval(SMOOTH_ZOOM_UPDATE_INTERVAL)
-        zoom_time_line.valueChanged.connect(partial(self.zoom_view, zoom))
-        zoom_time_line.finished.connect(self.zoom_finished)
-        zoom_time_line.start()
-
-    def zoom_view(self, zoom, time_line_value):  # PySide signal doesn't work without one more parameter from signal (time_line_value)
-        old_pos = self.view.mapToScene(zoom.pos.toPoint())
-        self.view.scale(zoom.factor, zoom.factor)
-
-        new_pos = self.view.mapToScene(zoom.pos.toPoint())
+        update_count = SMOOTH_ZOOM_DURATION / SMOOTH_ZOOM_UPDATE_INTERVAL
+        zoom_factor = 1 + zoom_factor / update_count
+
+        if not self._zoom_timer.isActive():
+            self._elapsed_timer.start()
+            self._zoom_timer.start()
+        # Store the total factor of the whole zoom, which was previously applied by parts on every update
+        self._active_zooms.append(_Zoom(event.position(), zoom_factor ** update_count, self._elapsed_timer.elapsed()))
+
+    def _on_zoom_timer_timeout(self):
+        elapsed_time = self._elapsed_timer.elapsed()
+        is_any_zoom_finished = False
+        for zoom in self._active_zooms:
+            # Apply the part of the zoom factor corresponding to the elapsed time,
+            # so the total zoom does not depend on the number of timer updates (e.g. if some of them were delayed)
+            progress = min((elapsed_time - zoom.start_time) / SMOOTH_ZOOM_DURATION, 1)
+            self.zoom_view(zoom.pos, zoom.factor ** (progress - zoom.progress))
+            zoom.progress = progress
+            if progress == 1:
+                is_any_zoom_finished = True
+
+        if is_any_zoom_finished:
+            self._active_zooms = [zoom for zoom in self._active_zooms if zoom.progress < 1]
+            if not self._active_zooms:
+                self._zoom_timer.stop()
+            self.zoom_finished.emit()
+
+    def zoom_view(self, pos: QPointF, factor: float):
+        old_pos = self.view.mapToScene(pos.toPoint())
+        self.view.scale(factor, factor)
+
+        new_pos = self.view.mapToScene(pos.toPoint())
 
         # Move the scene's view to old position
         delta = new_pos - old_pos
@@ -276,16 +328,11 @@ class _ViewSmoothZoom(QObject):
 
 
 class _Zoom:  # TODO: Use Python 3.7 dataclasses
-    def __init__(self, pos, factor):
+    def __init__(self, pos: QPointF, factor: float, start_time: int):
         self.pos = pos
         self.factor = factor
-
-
-class _ZoomTimeLine(QTimeLine):
-    def __init__(self, duration: int = 1000, parent: QObject = None):
-        super().__init__(duration, parent)
-
-        self.finished.connect(self.deleteLater)
+        self.start_time = start_time
+        self.progress = 0
 
 
 class _ViewPan(QObject):
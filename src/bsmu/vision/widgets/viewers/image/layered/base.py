@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 from PySide6.QtCore import QObject, Qt, Signal, QRectF, QPointF
 from PySide6.QtGui import QPainter, QImage
-from PySide6.QtWidgets import QGridLayout, QGraphicsScene, QGraphicsObject, QGraphicsItem
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsObject, QGraphicsItem, QVBoxLayout
 
 import bsmu.vision.core.converters.image as image_converter
 from bsmu.vision.core.image.base import Image, FlatImage
@@ -81,6 +81,9 @@ class ImageLayerView(QObject):
         self._displayed_pixels = None
         # Bounding boxes of modified regions, which we have to update in the |self._displayed_pixels|.
         self._modified_cache_bboxes = []
+        self._displayed_pixels_owned = False
+        self._displayed_qimage_format = None
+        self._displayed_qimage_cache_is_scaled = False
 
         self._view_min_spacing = None
 
@@ -149,8 +152,16 @@ class ImageLayerView(QObject):
 
     @property
     def displayed_image(self) -> QImage:
-        if self._displayed_qimage_cache is None or self._modified_cache_bboxes:
+        if self._displayed_qimage_cache is None:
             self._update_displayed_qimage_cache()
+        elif self._modified_cache_bboxes:
+            if self._displayed_qimage_cache_is_scaled \
+                    or self._displayed_pixels.shape[:2] != self.image_view.array.shape[:2]:
+                # Scaled QImage does not share data buffer with the |self._displayed_pixels|,
+                # so we cannot update only modified regions
+                self._update_displayed_qimage_cache()
+            else:
+                self._update_displayed_qimage_cache_in_modified_bboxes()
         return self._displayed_qimage_cache
 
     def calculate_view_min_spacing(self) -> float:
@@ -159,7 +170,7 @@ class ImageLayerView(QObject):
     def _update_displayed_qimage_cache(self):
         if self.image_view.is_indexed:
             self._displayed_pixels = self.image_view.pixels
-            displayed_qimage_format = QImage.Format_Indexed8
+            self._displayed_qimage_format = QImage.Format_Indexed8
         else:
             # self._displayed_pixels = image_converter.converted_to_normalized_uint8(self.image.array)
             # self._displayed_pixels = image_converter.converted_to_rgba(self._displayed_pixels)
@@ -168,19 +179,20 @@ class ImageLayerView(QObject):
             # but the QPainter can draw QImage.Format_RGBA8888_Premultiplied faster
             # (when multiple layers is drawn with semi-transparency), unlike QImage.Format_RGB888.
             # See: https://doc.qt.io/qt-6/qimage.html#Format-enum
-            self._displayed_pixels = image_converter.converted_to_rgba(self.image_view.array)
+            displayable_array = self._displayable_array(self.image_view.array)
+            self._displayed_pixels = image_converter.converted_to_rgba(
+                displayable_array, out=self._reusable_rgba_displayed_pixels(displayable_array))
 
-            displayed_qimage_format = QImage.Format_RGBA8888_Premultiplied \
+            self._displayed_qimage_format = QImage.Format_RGBA8888_Premultiplied \
                 if self._displayed_pixels.itemsize == 1 \
                 else QImage.Format_RGBA64_Premultiplied
 
         if not self._displayed_pixels.flags['C_CONTIGUOUS']:
             self._displayed_pixels = np.ascontiguousarray(self._displayed_pixels)
+        # Only own array (not the image view array itself) can be reused as a buffer for the next conversions
+        self._displayed_pixels_owned = not np.may_share_memory(self._displayed_pixels, self.image_view.array)
 
-        self._displayed_qimage_cache = image_converter.numpy_array_to_qimage(
-            self._displayed_pixels, displayed_qimage_format)
-        if self.image_view.is_indexed:
-            self._displayed_qimage_cache.setColorTable(self.image_view.palette.argb_quadruplets)
+        self._displayed_qimage_cache = self._displayed_pixels_to_qimage()
 
         # Scale image to take into account spatial attributes (spacings)
         width_spacing = self.image_view.spatial.spacing[1]
@@ -188,11 +200,62 @@ class ImageLayerView(QObject):
         spatial_width = width_spacing / self.view_min_spacing * self._displayed_qimage_cache.width()
         spatial_height = height_spacing / self.view_min_spacing * self._displayed_qimage_cache.height()
 
+        not_scaled_qimage_size = self._displayed_qimage_cache.size()
         self._displayed_qimage_cache = self._displayed_qimage_cache.scaled(
             spatial_width, spatial_height, mode=Qt.SmoothTransformation)
+        # QImage.scaled returns shallow copy (which shares data buffer), if the size is not changed
+        self._displayed_qimage_cache_is_scaled = self._displayed_qimage_cache.size() != not_scaled_qimage_size
+
+        self._modified_cache_bboxes = []
+
+    def _update_displayed_qimage_cache_in_modified_bboxes(self):
+        view_pixels = self.image_view.pixels
+        # If |self._displayed_pixels| is the view pixels array itself, then it already contains modified pixels
+        if view_pixels is not self._displayed_pixels:
+            for bbox in self._modified_cache_bboxes:
+                if self.image_view.is_indexed:
+                    bbox.pixels(self._displayed_pixels)[...] = bbox.pixels(view_pixels)
+                else:
+                    image_converter.converted_to_rgba(
+                        self._displayable_array(bbox.pixels(view_pixels)), out=bbox.pixels(self._displayed_pixels))
+
+        # QImage uses the same data buffer, but create a new QImage, else it will not know,
+        # that the data was changed (e.g. cached with the old QImage.cacheKey pixmaps will be used)
+        self._displayed_qimage_cache = self._displayed_pixels_to_qimage()
 
         self._modified_cache_bboxes = []
 
+    @staticmethod
+    def _displayable_array(array: np.ndarray) -> np.ndarray:
+        # Standard monitors show only 8 bits per channel, so there is no visual gain from 16-bit images,
+        # but QImage.Format_RGBA64_Premultiplied doubles the memory and the memory traffic while drawing
+        if array.dtype == np.uint16:
+            return image_converter.uint16_to_uint8(array)
+        return array
+
+    def _reusable_rgba_displayed_pixels(self, array: np.ndarray) -> np.ndarray | None:
+        """
+        Returns the current |self._displayed_pixels|, if they can be reused as a buffer
+        for the RGBA conversion of the |array|, to avoid a new allocation on every update.
+        """
+        if self._displayed_pixels is None or not self._displayed_pixels_owned:
+            return None
+
+        # Images that already have 4 channels are displayed without conversion (and so without a copy)
+        n_channels = array.shape[2] if array.ndim == 3 else 1
+        if n_channels not in (1, 3) \
+                or self._displayed_pixels.shape != (*array.shape[:2], 4) \
+                or self._displayed_pixels.dtype != array.dtype:
+            return None
+
+        return self._displayed_pixels
+
+    def _displayed_pixels_to_qimage(self) -> QImage:
+        displayed_qimage = image_converter.numpy_array_to_qimage(self._displayed_pixels, self._displayed_qimage_format)
+        if self._displayed_qimage_format == QImage.Format_Indexed8:
+            displayed_qimage.setColorTable(self.image_view.palette.argb_quadruplets)
+        return displayed_qimage
+
     def _on_layer_image_updated(self, image: Image):
         self.image_changed.emit(image)
         self._update_image_view()
@@ -209,6 +272,9 @@ class ImageLayerView(QObject):
         if self._image_view is not None and self._image_view.n_channels == 1 and not self._image_view.is_indexed:
             self.intensity_windowing = IntensityWindowing(self._image_view.array)
             self._image_view.array = self.intensity_windowing.windowing_applied()
+            # Windowing depends on all pixels, so the whole image has to be updated
+            self._displayed_qimage_cache = None
+            self._modified_cache_bboxes = []
         self.image_view_updated.emit(self.image_view)
 
 
@@ -377,9 +443,13 @@ class _LayeredImageGraphicsObject(QGraphicsObject):
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         # painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter_opacity = painter.opacity()
         for layer_view in self.layer_views:
-            if layer_view.visible and layer_view.image_view is not None:
-                painter.setOpacity(layer_view.opacity)
+            # Skip fully transparent layers to avoid the update of their displayed images and useless blending
+            if layer_view.visible and layer_view.opacity > 0 and layer_view.image_view is not None:
+                if layer_view.opacity != painter_opacity:
+                    painter_opacity = layer_view.opacity
+                    painter.setOpacity(painter_opacity)
                 image_view_origin = layer_view.image_view.spatial.origin
                 painter.drawImage(QPointF(image_view_origin[1], image_view_origin[0]), layer_view.displayed_image)
 
@@ -476,10 +546,9 @@ class LayeredImageViewer(DataViewer):
 
         self.graphics_scene.addItem(self.layered_image_graphics_object)
 
-        grid_layout = QGridLayout()
-        grid_layout.setContentsMargins(0, 0, 0, 0)
-        grid_layout.addWidget(self.graphics_view)
-        self.setLayout(grid_layout)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.graphics_view)
 
     @property
     def active_layer_view(self) -> ImageLayerView:
@@ -579,12 +648,24 @@ class LayeredImageViewer(DataViewer):
         return self.graphics_view.viewport()
 
     def viewport_pos_to_image_pixel_indexes(self, viewport_pos: QPoint, image: Image) -> np.ndarray:
-        layered_image_item_pos = self.viewport_pos_to_layered_image_item_pos(viewport_pos)
-        return image.pos_to_pixel_indexes(np.array([layered_image_item_pos.y(), layered_image_item_pos.x()])) \
-            * self.layered_image_graphics_object.view_min_spacing
+        return np.array(self._viewport_pos_to_image_pixel_float_indexes(viewport_pos, image))
+
+    def viewport_pos_to_image_pixel_indexes_rounded(self, viewport_pos: QPoint, image: Image) -> tuple[int, int]:
+        row, col = self._viewport_pos_to_image_pixel_float_indexes(viewport_pos, image)
+        # Python round uses the same rounding half to even as numpy.round
+        return round(row), round(col)
 
-    def viewport_pos_to_image_pixel_indexes_rounded(self, viewport_pos: QPoint, image: Image) -> np.ndarray:
-        return self.viewport_pos_to_image_pixel_indexes(viewport_pos, image).round().astype(np.int_)
+    def _viewport_pos_to_image_pixel_float_indexes(self, viewport_pos: QPoint, image: Image) -> tuple[float, float]:
+        # Use plain floats instead of temporary numpy arrays,
+        # because this method is called on every mouse move (e.g. while drawing with tools)
+        layered_image_item_pos = self.viewport_pos_to_layered_image_item_pos(viewport_pos)
+        origin = image.spatial.origin
+        spacing = image.spatial.spacing
+        view_min_spacing = self.layered_image_graphics_object.view_min_spacing
+        return (
+            (layered_image_item_pos.y() - float(origin[0])) / float(spacing[0]) * view_min_spacing,
+            (layered_image_item_pos.x() - float(origin[1])) / float(spacing[1]) * view_min_spacing,
+        )
 
     def viewport_pos_to_layered_image_item_pos(self, viewport_pos: QPoint) -> QPointF:
         scene_pos = self.graphics_view.mapToScene(viewport_pos)
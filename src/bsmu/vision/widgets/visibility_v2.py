@@ -28,6 +28,17 @@ class _VisibilityDrawer:
     SLIDER_THUMB_PEN_COLOR = QColor(167, 194, 224, SLIDER_THUMB_ALPHA)
     SLIDER_THUMB_BRUSH_COLOR = QColor(182, 204, 228, SLIDER_THUMB_ALPHA)
 
+    # Smooth scaling of icons is too slow to do it on every paint (e.g. for every row of a table)
+    _SCALED_ICON_CACHE_MAX_SIZE = 32
+    _scaled_icon_cache: dict[tuple[int, int, int], QPixmap] = {}  # {(pixmap cache key, width, height): QPixmap}
+
+    # Icons are the same for all drawers (e.g. for every table cell editor), so load them once.
+    # They are loaded lazily, because QPixmap cannot be created before the QGuiApplication
+    _checked_toggle_icon: QPixmap | None = None
+    _unchecked_toggle_icon: QPixmap | None = None
+    _value_up_icon: QPixmap | None = None
+    _value_down_icon: QPixmap | None = None
+
     class Element(Enum):
         TOGGLE_ICON = auto()
         SLIDER = auto()
@@ -44,11 +55,8 @@ class _VisibilityDrawer:
         self._visibility = visibility
         self._draw_slider_thumb = draw_slider_thumb
 
-        self._checked_toggle_icon = QPixmap(':/icons/eye-outlined.svg')
-        self._unchecked_toggle_icon = QPixmap(':/icons/eye-outlined-crossed-out.svg')
-
-        self._value_up_icon = QPixmap(':/icons/arrow-outlined-up.svg')
-        self._value_down_icon = QPixmap(':/icons/arrow-outlined-down.svg')
+        if _VisibilityDrawer._checked_toggle_icon is None:
+            self._load_icons()
 
         self._drawn_toggle_icon_rect_f = QRectF()
         self._drawn_text_rect_f = QRectF()
@@ -99,11 +107,8 @@ class _VisibilityDrawer:
         # Draw toggle icon
         toggle_icon_rect_f = QRectF(rect_f_without_margins)
         toggle_icon_rect_f.setWidth(toggle_icon_rect_f.width() / 4)
-        toggle_icon = toggle_icon.scaled(
-            int(toggle_icon_rect_f.width()),
-            int(toggle_icon_rect_f.height()),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation)
+        toggle_icon = self._scaled_icon(
+            toggle_icon, int(toggle_icon_rect_f.width()), int(toggle_icon_rect_f.height()))
         toggle_icon_top_left_y = toggle_icon_rect_f.y() + (toggle_icon_rect_f.height() - toggle_icon.height()) / 2
         toggle_icon_top_left_point_f = QPointF(toggle_icon_rect_f.x(), toggle_icon_top_left_y)
         painter.drawPixmap(toggle_icon_top_left_point_f, toggle_icon)
@@ -125,21 +130,15 @@ class _VisibilityDrawer:
         value_down_button_rect_f = QRectF(value_up_down_buttons_rect_f)
         value_down_button_rect_f.setTop(value_down_button_rect_f.bottom() - value_up_down_button_height)
 
-        value_up_icon = self._value_up_icon.scaled(
-            int(value_up_button_rect_f.width()),
-            int(value_up_button_rect_f.height()),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation)
+        value_up_icon = self._scaled_icon(
+            self._value_up_icon, int(value_up_button_rect_f.width()), int(value_up_button_rect_f.height()))
         value_up_top_left_y = value_up_button_rect_f.bottom() - value_up_icon.height()
         value_up_top_left_point_f = QPointF(value_up_button_rect_f.x(), value_up_top_left_y)
         painter.drawPixmap(value_up_top_left_point_f, value_up_icon)
         self._drawn_value_up_button = QRectF(value_up_top_left_point_f, value_up_icon.size())
 
-        value_down_icon = self._value_down_icon.scaled(
-            int(value_down_button_rect_f.width()),
-            int(value_down_button_rect_f.height()),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation)
+        value_down_icon = self._scaled_icon(
+            self._value_down_icon, int(value_down_button_rect_f.width()), int(value_down_button_rect_f.height()))
         painter.drawPixmap(value_down_button_rect_f.topLeft(), value_down_icon)
         self._drawn_value_down_button = QRectF(value_down_button_rect_f.topLeft(), value_down_icon.size())
 
@@ -179,6 +178,26 @@ class _VisibilityDrawer:
 
         painter.restore()
 
+    @classmethod
+    def _load_icons(cls):
+        cls._checked_toggle_icon = QPixmap(':/icons/eye-outlined.svg')
+        cls._unchecked_toggle_icon = QPixmap(':/icons/eye-outlined-crossed-out.svg')
+
+        cls._value_up_icon = QPixmap(':/icons/arrow-outlined-up.svg')
+        cls._value_down_icon = QPixmap(':/icons/arrow-outlined-down.svg')
+
+    @classmethod
+    def _scaled_icon(cls, icon: QPixmap, width: int, height: int) -> QPixmap:
+        key = (icon.cacheKey(), width, height)
+        scaled_icon = cls._scaled_icon_cache.get(key)
+        if scaled_icon is None:
+            scaled_icon = icon.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if len(cls._scaled_icon_cache) >= cls._SCALED_ICON_CACHE_MAX_SIZE:
+                # Remove the oldest item
+                del cls._scaled_icon_cache[next(iter(cls._scaled_icon_cache))]
+            cls._scaled_icon_cache[key] = scaled_icon
+        return scaled_icon
+
     def element_in_pos(self, pos: QPointF) -> Element:
         if self._drawn_toggle_icon_rect_f.contains(pos):
             return self.Element.TOGGLE_ICON
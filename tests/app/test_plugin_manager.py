@@ -0,0 +1,12 @@
+from bsmu.vision.app.plugin_manager import _parsed_plugin_expression
+
+
+def test_parsed_plugin_expression():
+    assert _parsed_plugin_expression('bsmu.vision.plugins.MdiPlugin') == \
+        (None, 'bsmu.vision.plugins.MdiPlugin', None, None)
+    assert _parsed_plugin_expression('mdi = bsmu.vision.plugins.MdiPlugin(main_window, settings)') == \
+        ('mdi', 'bsmu.vision.plugins.MdiPlugin', ('main_window', 'settings'), None)
+    assert _parsed_plugin_expression('bsmu.vision.plugins.Custom -> bsmu.vision.plugins.Base') == \
+        (None, 'bsmu.vision.plugins.Custom', None, 'bsmu.vision.plugins.Base')
+    assert _parsed_plugin_expression('custom=bsmu.vision.plugins.Custom(mdi)->bsmu.vision.plugins.Base') == \
+        ('custom', 'bsmu.vision.plugins.Custom', ('mdi',), 'bsmu.vision.plugins.Base')
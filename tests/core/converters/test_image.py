@@ -0,0 +1,20 @@
+import numpy as np
+
+from bsmu.vision.core.converters.image import normalized, normalized_uint8
+
+
+def test_normalized_uint8_float():
+    array = np.array([[-1.5, 0], [2.25, 7.1]], dtype=np.float32)
+    assert (normalized_uint8(array) == normalized(array, 0, 255).astype(np.uint8)).all()
+    assert normalized_uint8(array).min() == 0
+    assert normalized_uint8(array).max() == 255
+
+
+def test_normalized_uint8_int():
+    array = np.array([[10, 20], [30, 1010]], dtype=np.uint16)
+    assert (normalized_uint8(array) == normalized(array, 0, 255).astype(np.uint8)).all()
+
+
+def test_normalized_uint8_constant():
+    array = np.full((2, 3), 7, dtype=np.int16)
+    assert (normalized_uint8(array) == 0).all()
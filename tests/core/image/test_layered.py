@@ -0,0 +1,18 @@
+from bsmu.vision.core.image.layered import LayeredImage
+
+
+def test_remove_layer():
+    layered_image = LayeredImage()
+    layers = [layered_image.add_layer_from_image(None, name) for name in ('image', 'mask', 'roi', 'vessels')]
+
+    removed_layer_indexes = []
+    layered_image.layer_removed.connect(lambda layer, layer_index: removed_layer_indexes.append(layer_index))
+
+    layered_image.remove_layer(layers[1])
+    assert layered_image.layers == [layers[0], layers[2], layers[3]]
+    assert not layered_image.contains_layer('mask')
+
+    layered_image.remove_layer(layers[3])
+    layered_image.remove_layer(layers[0])
+    assert layered_image.layers == [layers[2]]
+    assert removed_layer_indexes == [1, 2, 0]
@@ -0,0 +1,13 @@
+import numpy as np
+
+from bsmu.vision.core.palette import Palette
+
+
+def test_premultiplied_array():
+    rgb, alpha = np.meshgrid(np.arange(256, dtype=np.uint8), np.arange(256, dtype=np.uint8))
+    palette_array = np.stack((rgb.ravel(), rgb.ravel(), rgb.ravel(), alpha.ravel()), axis=-1)
+    premultiplied_array = Palette(palette_array).premultiplied_array
+
+    expected_rgb = np.rint(palette_array[:, :3] * (palette_array[:, 3:4] / 255))
+    assert (premultiplied_array[:, :3] == expected_rgb).all()
+    assert (premultiplied_array[:, 3] == palette_array[:, 3]).all()
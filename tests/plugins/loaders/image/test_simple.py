@@ -0,0 +1,40 @@
+import cv2 as cv
+import numpy as np
+import pytest
+
+from bsmu.vision.plugins.loaders.image.simple import SimpleImageFileLoader
+
+
+def _write_rgb_slices(dir_path, slices):
+    paths = []
+    for index, pixels in enumerate(slices):
+        path = dir_path / f'slice-{index}.png'
+        cv.imencode('.png', cv.cvtColor(pixels, cv.COLOR_RGB2BGR))[1].tofile(path)
+        paths.append(path)
+    return paths
+
+
+def test_load_files(tmp_path):
+    rng = np.random.default_rng(0)
+    slices = rng.integers(0, 256, (5, 7, 9, 3), dtype=np.uint8)
+    paths = _write_rgb_slices(tmp_path, slices)
+
+    loader = SimpleImageFileLoader()
+    loaded_images = []
+    loader.file_loaded.connect(loaded_images.append)
+    volume_image = loader.load_files(paths)
+
+    assert np.array_equal(volume_image.pixels, slices)
+    assert volume_image.path == tmp_path
+    assert loaded_images == [volume_image]
+
+
+def test_load_files_shape_mismatch(tmp_path):
+    paths = _write_rgb_slices(tmp_path, [np.zeros((7, 9, 3), dtype=np.uint8), np.zeros((7, 8, 3), dtype=np.uint8)])
+    with pytest.raises(ValueError):
+        SimpleImageFileLoader().load_files(paths)
+
+
+def test_load_files_empty():
+    with pytest.raises(ValueError):
+        SimpleImageFileLoader().load_files([])
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+import skimage.io
+
+from bsmu.vision.core.image.base import FlatImage
+from bsmu.vision.plugins.writers.image.generic import GenericImageFileWriter
+
+_rng = np.random.default_rng(0)
+_SHAPE = (7, 9)
+
+
+@pytest.mark.parametrize('file_name, pixels', [
+    # Written using OpenCV
+    ('gray.png', _rng.integers(0, 256, _SHAPE, dtype=np.uint8)),
+    ('rgb.png', _rng.integers(0, 256, _SHAPE + (3,), dtype=np.uint8)),
+    ('rgba.png', _rng.integers(0, 256, _SHAPE + (4,), dtype=np.uint8)),
+    ('gray_uint16.png', _rng.integers(0, 65536, _SHAPE, dtype=np.uint16)),
+    ('rgb_uint16.tif', _rng.integers(0, 65536, _SHAPE + (3,), dtype=np.uint16)),
+    ('rgb.bmp', _rng.integers(0, 256, _SHAPE + (3,), dtype=np.uint8)),
+    ('gray_float32.tiff', _rng.random(_SHAPE, dtype=np.float32)),
+    ('маска.png', _rng.integers(0, 256, _SHAPE, dtype=np.uint8)),
+    # Written using skimage
+    ('gray_alpha.png', _rng.integers(0, 256, _SHAPE + (2,), dtype=np.uint8)),
+    ('gray_float64.tif', _rng.random(_SHAPE)),
+    ('gray_int16.tif', _rng.integers(-1000, 1000, _SHAPE, dtype=np.int16)),
+])
+def test_write_to_file_round_trip(tmp_path, file_name, pixels):
+    path = tmp_path / file_name
+    GenericImageFileWriter().write_to_file(FlatImage(pixels), path)
+
+    read_pixels = skimage.io.imread(str(path))
+    assert read_pixels.dtype == pixels.dtype
+    assert np.array_equal(read_pixels, pixels)